@@ -1,71 +1,197 @@
-from flask import Flask, jsonify, request, make_response
+from flask import Flask, Response, jsonify, request, make_response
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+import orjson
 import requests
-import random
-import cv2
-import numpy as np
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import base64
+import contextlib
+import functools
+import hashlib
 from io import BytesIO
-from PIL import Image
+from PIL import Image, ImageFilter
 import json
+import mimetypes
 import os
+import threading
+import time
 from datetime import datetime, timezone, timedelta
 from apscheduler.schedulers.background import BackgroundScheduler
 
+class OrjsonProvider(JSONProvider):
+    """Serialize responses with orjson; its C string escaping handles the base64 images"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
-CORS(app)
+app.json = OrjsonProvider(app)
+# Age lets the frontend correct next_reset in responses served from a shared cache
+CORS(app, expose_headers=['Age'])
+
+# Equivalent to cv2.GaussianBlur(..., (99, 99), 0): sigma = 0.3 * ((99 - 1) * 0.5 - 1) + 0.8
+BLUR_SIGMA = 15.2
+
+SECONDS_PER_DAY = 86400
+
+# Largest flag edge worth keeping; the UI never shows flags wider than this
+MAX_FLAG_SIZE = (800, 800)
+
+# Shared HTTP session so repeated fetches reuse pooled connections
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                                      max_retries=Retry(total=2, backoff_factor=0.3)))
+SESSION.headers.update({'Accept-Encoding': 'gzip', 'User-Agent': 'daily-game/1'})
+
+COUNTRIES_URL = 'https://restcountries.com/v3.1/all?fields=name,cca2,flags,capital,region,population'
+
+# One JSON file per date, shared by all server processes
+CACHE_DIR = 'daily_cache'
+# Held while a process builds a day's country so the others wait and reuse it
+REFRESH_LOCK_FILE = 'daily_refresh.lock'
+PLACEHOLDER_IMAGE = 'placeholder_base64'
+# How long a worker serves a placeholder before trying the day's flag again
+PLACEHOLDER_RETRY_SECONDS = 60
+PNG_DATA_URL_PREFIX = b'data:image/png;base64,'
+POOL_FILE = 'pool.json'
+
+# Rendered flags are served by Flask's static route; names are per-date so they never change
+FLAGS_DIR = os.path.join(app.static_folder, 'flags')
+FLAG_CACHE_CONTROL = 'public, max-age=3600, immutable'
+mimetypes.add_type('image/webp', '.webp')
+
+def _write_json_atomic(path, data):
+    """Write JSON via a temp file so readers never see a partially written file"""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def _prune_dated_files(directory, date_str):
+    """Delete files named with a date older than the day before date_str"""
+    cutoff = (datetime.fromisoformat(date_str) - timedelta(days=1)).strftime('%Y-%m-%d')
+    for filename in os.listdir(directory):
+        # File names start with their YYYY-MM-DD date, so they sort by day
+        if filename[:10] < cutoff:
+            try:
+                os.remove(os.path.join(directory, filename))
+            except OSError:
+                pass
+
+# Stands in for the file lock where fcntl is missing (Windows dev server, one process)
+_REFRESH_THREAD_LOCK = threading.Lock()
+
+@contextlib.contextmanager
+def _refresh_file_lock():
+    """Exclusive lock across processes and threads (each call opens its own handle)"""
+    try:
+        # Imported here so the module still loads on platforms without fcntl
+        import fcntl
+    except ImportError:
+        with _REFRESH_THREAD_LOCK:
+            yield
+        return
+    with open(REFRESH_LOCK_FILE, 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+@functools.lru_cache(maxsize=2)
+def _reset_at_second(bucket):
+    """Seconds until the next UTC midnight, computed once per whole second"""
+    now = datetime.fromtimestamp(bucket, timezone.utc)
+    tomorrow = (now + timedelta(days=1)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    return int((tomorrow - now).total_seconds())
 
 class DailyCountryGame:
     def __init__(self):
         self.current_country = None
         self.blurred_flag = None
-        self.last_reset_date = None
+        self.last_reset_day = None  # UTC day number, compared on every request
+        self.last_reset_date = None  # Same day as YYYY-MM-DD, for responses
         self.country_pool = []
-        self.cached_country = None
-        self.cached_date = None
+        self._state_prefixes = {}
+        self._state_validators = {}  # inline -> (etag, last_modified); empty for placeholders
+        self._retry_at = None  # Set while serving a placeholder; time to rebuild
+        self._reset_lock = threading.RLock()
         
-    def _get_current_date(self):
-        """Get current UTC date string"""
-        return datetime.now(timezone.utc).strftime('%Y-%m-%d')
-    
-    def _load_cache(self):
-        """Load cached country data if it exists"""
-        current_date = self._get_current_date()
-        if self.cached_date == current_date and self.cached_country:
-            return self.cached_country
-        return None
+    def _get_current_day(self):
+        """Get current UTC day as days since the Unix epoch"""
+        return int(time.time()) // SECONDS_PER_DAY
+
+    def _format_day(self, day):
+        """Format a UTC day number as a YYYY-MM-DD string"""
+        return time.strftime('%Y-%m-%d', time.gmtime(day * SECONDS_PER_DAY))
+
+    def _load_cache(self, date_str):
+        """Load cached country data for a date if it exists"""
+        try:
+            with open(os.path.join(CACHE_DIR, f"{date_str}.json"), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Error reading cache file: {e}")
+            return None
     
-    def _save_cache(self, country_data):
-        """Save country data to cache"""
-        self.cached_date = self._get_current_date()
-        self.cached_country = country_data
+    def _save_cache(self, date_str, country_data):
+        """Save country data to the cache for a date"""
+        if country_data['blurred_image'] == PLACEHOLDER_IMAGE:
+            # Leave the date uncached so the next refresh retries the download
+            return
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            _write_json_atomic(os.path.join(CACHE_DIR, f"{date_str}.json"), country_data)
+            _prune_dated_files(CACHE_DIR, date_str)
+        except Exception as e:
+            print(f"Error writing cache file: {e}")
     
     def _fetch_country_pool(self):
         try:
-            response = requests.get('https://restcountries.com/v3.1/all')
+            response = SESSION.get(COUNTRIES_URL, timeout=30)
             if response.status_code == 200:
                 countries = response.json()
-                # Filter out very small countries or territories
+                # Single pass: filter out very small countries or territories and
+                # keep only the fields the game serves
                 self.country_pool = [
-                    country for country in countries 
+                    {
+                        'code': country['cca2'],
+                        'name': country['name']['common'],
+                        'flag_url': country['flags']['png'],
+                        'capital': country['capital'][0] if country.get('capital') else 'N/A',
+                        'continent': country.get('region', 'Unknown'),
+                        'population': country.get('population', 0)
+                    }
+                    for country in countries
                     if country.get('population', 0) > 500000
                     and country.get('cca2')  # Ensure country code exists
+                    # Skip malformed entries rather than failing the whole pool
+                    and country.get('name', {}).get('common')
+                    and country.get('flags', {}).get('png')
                 ]
+                # Stable order so every day maps to the same country across fetches
+                self.country_pool.sort(key=lambda country: country['code'])
                 
                 # Generate list of country names for autocomplete with error handling
                 try:
-                    country_names = [country['name']['common'] for country in self.country_pool]
                     # Sort the country names alphabetically
-                    country_names.sort()
-                    with open('country_names.json', 'w', encoding='utf-8') as f:
-                        json.dump(country_names, f, ensure_ascii=False)
+                    country_names = sorted(country['name'] for country in self.country_pool)
+                    _write_json_atomic('country_names.json', country_names)
                 except Exception as write_error:
                     print(f"Error writing country names: {write_error}")
                 
-                # Shuffle the pool using today's date as seed
-                today = self._get_current_date()
-                random.seed(today)
-                random.shuffle(self.country_pool)
+                try:
+                    _write_json_atomic(POOL_FILE, self.country_pool)
+                except Exception as write_error:
+                    print(f"Error writing country pool: {write_error}")
                 return
             print("Failed to fetch countries")
             # self._load_backup_countries()
@@ -73,15 +199,53 @@ class DailyCountryGame:
             print(f"Error fetching country pool: {str(e)}")
             # self._load_backup_countries()
 
-    def _process_images(self):
-        """Process and blur flag image while maintaining original dimensions"""
+    def _ensure_pool_loaded(self):
+        """Load the country pool from disk, fetching it from the API only once"""
+        if self.country_pool:
+            return
+        try:
+            with open(POOL_FILE, 'r', encoding='utf-8') as f:
+                self.country_pool = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error reading country pool: {e}")
+        if not self.country_pool:
+            self._fetch_country_pool()
+
+    def _country_for_date(self, date_str):
+        """Deterministically pick the pool entry scheduled for a given date"""
+        # Hashing the date keeps the order unpredictable without touching global RNG state
+        digest = hashlib.blake2b(date_str.encode(), digest_size=8).digest()
+        idx = int.from_bytes(digest, 'big') % len(self.country_pool)
+        return self.country_pool[idx]
+
+    def _save_flag_file(self, country, blurred, date_str):
+        """Write the blurred flag as a WebP file and record its static URL"""
+        # Only the blurred flag is published; the original would leak the answer
         try:
-            flag_url = self.current_country.get('flag_url')
+            os.makedirs(FLAGS_DIR, exist_ok=True)
+            filename = f"{date_str}_blurred.webp"
+            path = os.path.join(FLAGS_DIR, filename)
+            # Served as immutable, so never expose a partially written file
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            blurred.save(tmp_path, 'WEBP', quality=80, method=4)
+            os.replace(tmp_path, path)
+            country['blurred_image_url'] = f"/static/flags/{filename}"
+            _prune_dated_files(FLAGS_DIR, date_str)
+        except Exception as e:
+            # The inline base64 images still work without the static files
+            print(f"Error writing flag files: {e}")
+
+    def _process_images(self, country, date_str):
+        """Process and blur flag image, downscaled to display size"""
+        try:
+            flag_url = country.get('flag_url')
             
             if not flag_url:
                 raise ValueError("No flag URL available")
             
-            response = requests.get(flag_url, stream=True, verify=True, timeout=10)
+            response = SESSION.get(flag_url, stream=True, verify=True, timeout=10)
             
             if response.status_code != 200:
                 raise ValueError(f"Failed to fetch image. Status code: {response.status_code}")
@@ -89,29 +253,41 @@ class DailyCountryGame:
             # Read image content and create PIL Image
             img = Image.open(BytesIO(response.content))
             
-            # Convert to RGB while preserving original size
-            img = img.convert('RGB')
+            # Convert to RGB; convert() always copies
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+            
+            # Shrink oversized flags first so blur and encoding touch fewer pixels
+            original_width = img.width
+            img.thumbnail(MAX_FLAG_SIZE, Image.Resampling.LANCZOS)
             
-            # Convert to numpy array while maintaining dimensions
-            img_array = np.array(img)
+            # Create blurred version at the same size. PIL runs the Gaussian as
+            # two separable 1-D passes; sigma matches the one OpenCV derives for
+            # a 99x99 kernel, scaled with the image so the blur looks the same.
+            sigma = BLUR_SIGMA * img.width / original_width
+            blurred = img.filter(ImageFilter.GaussianBlur(radius=sigma))
             
-            # Create blurred version while maintaining size
-            blurred = cv2.GaussianBlur(img_array, (99, 99), 0)
+            # One buffer shared by both encodes
+            buffered = BytesIO()
             
-            def img_to_base64(img_array):
-                # Create PIL Image while preserving dimensions
-                img = Image.fromarray(img_array.astype('uint8'))
-                buffered = BytesIO()
-                # Save with original size
-                img.save(buffered, format="PNG", optimize=True)
-                return f"data:image/png;base64,{base64.b64encode(buffered.getvalue()).decode()}"
+            def img_to_base64(img):
+                buffered.seek(0)
+                buffered.truncate()
+                # Fast zlib level since flags are re-encoded daily
+                img.save(buffered, format="PNG", optimize=False, compress_level=1)
+                # Encode straight from the buffer's memory instead of a getvalue() copy;
+                # the view is released so the buffer can be reused
+                with buffered.getbuffer() as raw:
+                    encoded = base64.b64encode(raw)
+                return (PNG_DATA_URL_PREFIX + encoded).decode('ascii')
             
             # Store both versions
-            self.current_country['blurred_image'] = img_to_base64(blurred)
-            self.current_country['unblurred_image'] = img_to_base64(img_array)
+            country['blurred_image'] = img_to_base64(blurred)
+            country['unblurred_image'] = img_to_base64(img)
+            self._save_flag_file(country, blurred, date_str)
             
         except Exception as e:
-            self._use_placeholder_image()
+            self._use_placeholder_image(country)
 
 
     # def _load_backup_countries(self):
@@ -128,87 +304,187 @@ class DailyCountryGame:
     
     def get_daily_country(self):
         """Get or generate country for current day"""
-        current_date = self._get_current_date()
+        current_day = self._get_current_day()
         
-        # Check if we need to reset
-        if self.last_reset_date != current_date:
-            # Try to load from cache first
-            cached_country = self._load_cache()
-            if cached_country:
-                self.current_country = cached_country
-                self._process_images()  # Ensure images are processed for cached data
-            else:
-                # Fetch new country data
-                if not self.country_pool:
-                    self._fetch_country_pool()
-                
-                # if not self.country_pool:
-                #     self._load_backup_countries()
-                
-                if self.country_pool:
-                    country = self.country_pool[0]
-                    self.current_country = {
-                        'name': country['name']['common'],
-                        'flag_url': country['flags']['png'],
-                        'capital': country['capital'][0] if country.get('capital') else 'N/A',
-                        'continent': country.get('region', 'Unknown'),
-                        'population': country.get('population', 0)
-                    }
-                    self._process_images()
-                    self._save_cache(self.current_country)
-                else:
-                    print("Error: No country available in pool or backup.")
-                    return None
+        # Check if we need to reset; the lock keeps concurrent requests from
+        # refreshing the same day twice
+        if self._needs_refresh(current_day):
+            with self._reset_lock:
+                if self._needs_refresh(current_day):
+                    current_date = self._format_day(current_day)
+                    country = self._prepare_country(current_date)
+                    if not country:
+                        print("Error: No country available in pool or backup.")
+                        if self.last_reset_day == current_day:
+                            # Keep serving today's placeholder and retry later
+                            self._retry_at = time.time() + PLACEHOLDER_RETRY_SECONDS
+                            return self.current_country
+                        return None
                     
-            self.last_reset_date = current_date
+                    # Day-invariant values read on every request
+                    country['_name_cf'] = country['name'].casefold()
+                    # Stable across workers and restarts, and within JS's 2**53 integer range
+                    country['_game_id'] = int.from_bytes(
+                        hashlib.blake2b(country['name'].encode(), digest_size=6).digest(), 'big')
+                    state_prefixes = self._build_state_prefixes(country, current_date)
+                    state_validators = self._build_state_validators(country, current_day, state_prefixes)
+                    
+                    # Publish only fully built state; readers do not take the lock,
+                    # and last_reset_day goes last since it gates the fast path
+                    self.current_country = country
+                    self._state_prefixes = state_prefixes
+                    self._state_validators = state_validators
+                    self.last_reset_date = current_date
+                    # A placeholder is retried later; _prepare_country then picks up
+                    # another worker's successful build from the cache
+                    if country['blurred_image'] == PLACEHOLDER_IMAGE:
+                        self._retry_at = time.time() + PLACEHOLDER_RETRY_SECONDS
+                    else:
+                        self._retry_at = None
+                    self.last_reset_day = current_day
         
         return self.current_country
 
-    def _use_placeholder_image(self):
+    def _needs_refresh(self, current_day):
+        """True on a new UTC day, or once a placeholder's retry time has passed"""
+        if self.last_reset_day != current_day:
+            return True
+        retry_at = self._retry_at
+        return retry_at is not None and time.time() >= retry_at
+
+    def _prepare_country(self, current_date):
+        """Build the complete country dict for a date, images included"""
+        # Try to load from cache first; the preload usually wrote it before midnight
+        cached_country = self._load_cache(current_date)
+        if cached_country:
+            return cached_country
+        
+        # Only one process builds the day; the rest wait here and reuse its cache
+        with _refresh_file_lock():
+            cached_country = self._load_cache(current_date)
+            if cached_country:
+                return cached_country
+            
+            # Fetch new country data
+            self._ensure_pool_loaded()
+            
+            # if not self.country_pool:
+            #     self._load_backup_countries()
+            
+            if not self.country_pool:
+                return None
+            country = dict(self._country_for_date(current_date))
+            self._process_images(country, current_date)
+            self._save_cache(current_date, country)
+            return country
+
+    def _build_state_prefixes(self, country, current_date):
+        """Pre-serialize the day-invariant part of the game-state response"""
+        state = {
+            'blurred_image_url': country.get('blurred_image_url'),
+            'game_id': country['_game_id'],
+            'current_date': current_date,
+        }
+        # Inline base64 is kept for clients that cannot fetch the static file
+        inline_state = dict(state, blurred_image=country['blurred_image'])
+        if not state['blurred_image_url']:
+            state = inline_state
+        # Drop the closing brace so next_reset can be appended per request
+        return {
+            inline: orjson.dumps(body)[:-1] + b',"next_reset":'
+            for inline, body in ((False, state), (True, inline_state))
+        }
+
+    def _build_state_validators(self, country, current_day, state_prefixes):
+        """ETag and Last-Modified for each game-state variant, computed once per day"""
+        if country['blurred_image'] == PLACEHOLDER_IMAGE:
+            # Never let caches keep a placeholder
+            return {}
+        last_modified = datetime.fromtimestamp(current_day * SECONDS_PER_DAY, timezone.utc)
+        # Hash the body so workers agree on the ETag only when they serve the same content
+        return {
+            inline: (hashlib.blake2b(prefix, digest_size=16).hexdigest(), last_modified)
+            for inline, prefix in state_prefixes.items()
+        }
+
+    def get_state_validators(self, inline=False):
+        """(etag, last_modified) for the game-state response, or None if it must not be cached"""
+        return self._state_validators.get(inline)
+
+    def get_state_body(self, inline=False):
+        """Game-state JSON with the current countdown spliced in"""
+        return self._state_prefixes[inline] + str(self.get_next_reset_time()).encode() + b'}'
+
+    def _use_placeholder_image(self, country):
         """Use placeholder if image processing fails"""
-        self.current_country['blurred_image'] = "placeholder_base64"
-        self.current_country['unblurred_image'] = "placeholder_base64"
+        country['blurred_image'] = PLACEHOLDER_IMAGE
+        country['unblurred_image'] = PLACEHOLDER_IMAGE
+        country['blurred_image_url'] = None
 
     def get_next_reset_time(self):
         """Get time until next reset"""
-        now = datetime.now(timezone.utc)
-        tomorrow = (now + timedelta(days=1)).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        return int((tomorrow - now).total_seconds())
+        return _reset_at_second(int(time.time()))
     
     def daily_check(self):
         """Check if the cache needs to be reset and load new data if required."""
-        current_date = self._get_current_date()
-        if self.last_reset_date != current_date:
-            self.current_country = None  # Invalidate current country data
-            new_country = self._load_cache()  # Attempt to load or refresh cache
-            if not new_country:
-                # Force a refresh of the country pool
-                self.country_pool = []
-                self._fetch_country_pool()
-                self.get_daily_country()  # This will generate and cache new country
+        if self.last_reset_day != self._get_current_day():
+            # The current country is replaced under the reset lock rather than
+            # cleared first, so concurrent guesses never see an empty game
+            self.get_daily_country()  # Promotes the preloaded country if there is one
+
+    def _preload_tomorrow(self):
+        """Download and blur tomorrow's flag into the cache ahead of the midnight rollover"""
+        tomorrow = self._format_day(self._get_current_day() + 1)
+        # The refresh file lock serializes this with request threads and other
+        # workers, including the pool load
+        self._prepare_country(tomorrow)
 
 game = DailyCountryGame()
 
 @app.route('/api/game-state', methods=['GET'])
 def get_game_state():
     country = game.get_daily_country()
-    next_reset = game.get_next_reset_time()
+    if not country:
+        return jsonify({'error': 'No active game'}), 503
     
-    return jsonify({
-        'blurred_image': country['blurred_image'],
-        'game_id': hash(country['name']),
-        'next_reset': next_reset,
-        'current_date': game.last_reset_date,
-    })
+    inline = request.args.get('inline') == '1'
+    resp = Response(game.get_state_body(inline=inline), mimetype='application/json')
+    validators = game.get_state_validators(inline=inline)
+    if validators is None:
+        resp.cache_control.no_store = True
+        return resp
+    
+    # The body only changes at UTC midnight, so clients can revalidate it
+    etag, last_modified = validators
+    resp.set_etag(etag)
+    resp.last_modified = last_modified
+    resp.cache_control.public = True
+    resp.cache_control.max_age = game.get_next_reset_time()
+    # Answers 304 for a matching If-None-Match or If-Modified-Since
+    return resp.make_conditional(request)
+
+@app.after_request
+def add_flag_cache_headers(response):
+    if request.path.startswith('/static/flags/') and response.status_code == 200:
+        response.headers['Cache-Control'] = FLAG_CACHE_CONTROL
+    return response
+
+# Parsed country_names.json, reloaded only when the file's mtime changes
+_NAMES_CACHE = {'mtime': 0, 'data': None}
 
 @app.route('/api/player-names', methods=['GET'])
 def get_country_names():
+    global _NAMES_CACHE
     try:
-        with open('country_names.json', 'r') as f:
-            country_names = json.load(f)
-        return jsonify(country_names)
+        st = os.stat('country_names.json')
+        if st.st_mtime != _NAMES_CACHE['mtime']:
+            with open('country_names.json', 'r', encoding='utf-8') as f:
+                _NAMES_CACHE = {'mtime': st.st_mtime, 'data': json.load(f)}
+        return jsonify(_NAMES_CACHE['data'])
+    except ValueError as e:
+        # Unreadable file; keep serving the last list that parsed
+        print(f"Error reading country names: {e}")
+        return jsonify(_NAMES_CACHE['data'] or [])
     except FileNotFoundError:
         # Create the file with an empty list if it doesn't exist
         with open('country_names.json', 'w') as f:
@@ -218,13 +494,15 @@ def get_country_names():
 @app.route('/api/guess', methods=['POST'])
 def check_guess():
     data = request.get_json()
-    guess = data.get('guess', '').lower()
+    guess = data.get('guess', '').casefold()
     current_hint_level = data.get('hint_level', 0)
     
-    if not game.current_country:
+    # Read the published country once so a rollover mid-request cannot mix days
+    country = game.current_country
+    if not country:
         return jsonify({'error': 'No active game'}), 400
     
-    correct = guess == game.current_country['name'].lower()
+    correct = guess == country['_name_cf']
     
     response = {
         'correct': correct,
@@ -238,8 +516,8 @@ def check_guess():
     # Show original flag and country name for game over scenarios
     if correct or current_hint_level >= 4:
         response['hint_image'] = None
-        response['image_url'] = game.current_country['flag_url']
-        response['player_name'] = game.current_country['name']
+        response['image_url'] = country['flag_url']
+        response['player_name'] = country['name']
         
         resp = make_response(jsonify(response))
         return resp
@@ -248,23 +526,30 @@ def check_guess():
     if not correct and current_hint_level < 4:
         if current_hint_level == 0:
             response['hint_text'] = "Unblurred Flag"
-            response['hint_image'] = game.current_country['unblurred_image']
+            response['hint_image'] = country['unblurred_image']
         elif current_hint_level == 1:
-            response['hint_text'] = f"Population: {game.current_country['population']:,}"
-            response['hint_image'] = game.current_country['unblurred_image']
+            response['hint_text'] = f"Population: {country['population']:,}"
+            response['hint_image'] = country['unblurred_image']
         elif current_hint_level == 2:
-            response['hint_text'] = f"Continent: {game.current_country['continent']}"
-            response['hint_image'] = game.current_country['unblurred_image']
+            response['hint_text'] = f"Continent: {country['continent']}"
+            response['hint_image'] = country['unblurred_image']
         elif current_hint_level == 3:
-            response['hint_text'] = f"Capital: {game.current_country['capital']}"
-            response['hint_image'] = game.current_country['flag_url']
+            response['hint_text'] = f"Capital: {country['capital']}"
+            response['hint_image'] = country['flag_url']
     
     return jsonify(response)
 
-if __name__ == '__main__':
+def start_scheduler():
+    """Run the daily jobs in the background; called once per server process"""
     scheduler = BackgroundScheduler()
     scheduler.add_job(game.daily_check, 'interval', days=1, 
                      start_date='2024-11-09 00:00:00',
                      timezone=timezone.utc)
+    scheduler.add_job(game._preload_tomorrow, 'cron', hour=23, minute=55,
+                     timezone=timezone.utc)
     scheduler.start()
-    app.run()
\ No newline at end of file
+    return scheduler
+
+if __name__ == '__main__':
+    start_scheduler()
+    app.run(threaded=True)
\ No newline at end of file
@@ -1,4 +0,0 @@
-# gunicorn.conf.py
-workers = 4
-bind = "0.0.0.0:10000"
-timeout = 120
\ No newline at end of file
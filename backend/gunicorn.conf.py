@@ -0,0 +1,14 @@
+# gunicorn.conf.py
+workers = 4
+worker_class = "gthread"
+threads = 8
+bind = "0.0.0.0:10000"
+timeout = 120
+
+
+def post_worker_init(worker):
+    # Each worker keeps its own game state and runs the daily jobs. The jobs
+    # take a shared file lock, so only one worker downloads and renders a day;
+    # the others load the result from the on-disk cache.
+    from daily_game_backend import start_scheduler
+    start_scheduler()
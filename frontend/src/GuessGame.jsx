@@ -99,12 +99,19 @@ const GuessGame = () => {
     try {
       const response = await fetch(`${API_URL}/api/game-state`);
       const data = await response.json();
+      // The response may come from a cache; subtract its Age so the server's
+      // countdown stays right. The client clock is only a fallback.
+      const age = Number(response.headers.get('Age') || 0);
+      const resetAt = Date.parse(`${data.current_date}T00:00:00Z`) + 24 * 60 * 60 * 1000;
+      const nextReset = Number.isFinite(data.next_reset)
+        ? Math.max(0, data.next_reset - age)
+        : Math.max(0, Math.floor((resetAt - Date.now()) / 1000));
       
       setGameState(prev => ({
         ...prev,
-        currentImage: data.blurred_image,
+        currentImage: data.blurred_image_url ? `${API_URL}${data.blurred_image_url}` : data.blurred_image,
         gameId: data.game_id,
-        nextReset: data.next_reset,
+        nextReset: nextReset,
         currentDate: data.current_date,
         loading: false
       }));